@@ -3,10 +3,11 @@ Core game logic for Minesweeper.
 
 This module contains pure domain logic without any pygame or pixel-level
 concerns. It defines:
-- CellState: the state of a single cell
-- Cell: a cell positioned by (col,row) with an attached CellState
 - Board: grid management, mine placement, adjacency computation, reveal/flag
 
+Cell state is stored as parallel flat arrays on the Board (one entry per
+cell, indexed by row * cols + col) rather than as per-cell objects.
+
 The Board exposes imperative methods that the presentation layer (run.py)
 can call in response to user inputs, and does not know anything about
 rendering, timing, or input devices.
@@ -15,154 +16,214 @@ rendering, timing, or input devices.
 import random
 from typing import List, Tuple
 
-class CellState:
-    """Mutable state of a single cell.
-
-    Attributes:
-        is_mine: Whether this cell contains a mine.
-        is_revealed: Whether the cell has been revealed to the player.
-        is_flagged: Whether the player flagged this cell as a mine.
-        adjacent: Number of adjacent mines in the 8 neighboring cells.
-    """
-
-    def __init__(self, is_mine: bool = False, is_revealed: bool = False, is_flagged: bool = False, adjacent: int = 0):
-        self.is_mine = is_mine
-        self.is_revealed = is_revealed
-        self.is_flagged = is_flagged
-        self.adjacent = adjacent
-
-class Cell:
-    """Logical cell positioned on the board by column and row."""
-
-    def __init__(self, col: int, row: int):
-        self.col = col
-        self.row = row
-        self.state = CellState()
+# Offsets (dc, dr) of the 8 neighbors around a cell
+_DELTAS = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0),           (1, 0),
+    (-1, 1),  (0, 1),  (1, 1),
+)
 
 class Board:
-    """Minesweeper board state and rules.
-
-    Responsibilities:
-    - Generate and place mines with first-click safety
-    - Compute adjacency counts for every cell
-    - Reveal cells (iterative flood fill when adjacent == 0)
-    - Toggle flags, check win/lose conditions
-    """
-
-    def __init__(self, cols: int, rows: int, mines: int):
-        self.cols = cols
-        self.rows = rows
-        self.num_mines = mines
-        self.cells: List[Cell] = [Cell(c, r) for r in range(rows) for c in range(cols)]
-        self._mines_placed = False
-        self.revealed_count = 0
-        self.game_over = False
-        self.win = False
-
-    def index(self, col: int, row: int) -> int:
-        """Return the flat list index for (col,row)."""
-        return row * self.cols + col
-
-    def is_inbounds(self, col: int, row: int) -> bool:
-        """Return True if (col,row) is inside the board bounds."""
-        return 0 <= col < self.cols and 0 <= row < self.rows
-
-    def neighbors(self, col: int, row: int) -> List[Tuple[int, int]]:
-        """Return list of valid neighboring coordinates around (col,row)."""
-        deltas = [
-            (-1, -1), (0, -1), (1, -1),
-            (-1, 0),           (1, 0),
-            (-1, 1),  (0, 1),  (1, 1),
-        ]
-        result = []
-        for dc, dr in deltas:
-            nc, nr = col + dc, row + dr
-            if self.is_inbounds(nc, nr):
-                result.append((nc, nr))
-        return result
-
-    def place_mines(self, safe_col: int, safe_row: int) -> None:
-        """Place mines randomly, guaranteeing the first click and its neighbors are safe. Then compute adjacency counts."""
-        all_positions = [(c, r) for r in range(self.rows) for c in range(self.cols)]
-        forbidden = {(safe_col, safe_row)} | set(self.neighbors(safe_col, safe_row))
-        pool = [p for p in all_positions if p not in forbidden]
-        random.shuffle(pool)
-
-        for c, r in pool[:self.num_mines]:
-            self.cells[self.index(c, r)].state.is_mine = True
-
-        # Compute adjacency counts
-        for r in range(self.rows):
-            for c in range(self.cols):
-                cell = self.cells[self.index(c, r)]
-                if cell.state.is_mine:
-                    continue
-                count = sum(
-                    1 for nc, nr in self.neighbors(c, r)
-                    if self.cells[self.index(nc, nr)].state.is_mine
-                )
-                cell.state.adjacent = count
-
-        self._mines_placed = True
-
-    def reveal(self, col: int, row: int) -> None:
-        """Reveal a cell; if zero-adjacent, iteratively flood to neighbors."""
-        if not self.is_inbounds(col, row):
-            return
-
-        cell = self.cells[self.index(col, row)]
-
-        if cell.state.is_revealed or cell.state.is_flagged:
-            return
-
-        if not self._mines_placed:
-            self.place_mines(col, row)
-
-        stack = [(col, row)]
-        while stack:
-            c, r = stack.pop()
-            current = self.cells[self.index(c, r)]
-            if current.state.is_revealed or current.state.is_flagged:
-                continue
-            current.state.is_revealed = True
-            self.revealed_count += 1
-            if current.state.is_mine:
-                self.game_over = True
-                self._reveal_all_mines()
-                return
-            elif current.state.adjacent == 0:
-                for nc, nr in self.neighbors(c, r):
-                    neighbor_cell = self.cells[self.index(nc, nr)]
-                    if not neighbor_cell.state.is_revealed and not neighbor_cell.state.is_flagged:
-                        stack.append((nc, nr))
-
-        self._check_win()
-
-    def toggle_flag(self, col: int, row: int) -> None:
-        """Toggle a flag on a non-revealed cell."""
-        if not self.is_inbounds(col, row):
-            return
-        cell = self.cells[self.index(col, row)]
-        if not cell.state.is_revealed:
-            cell.state.is_flagged = not cell.state.is_flagged
-
-    def flagged_count(self) -> int:
-        """Return current number of flagged cells."""
-        return sum(1 for cell in self.cells if cell.state.is_flagged)
-
-    def _reveal_all_mines(self) -> None:
-        """Reveal all mines; called on game over."""
-        for cell in self.cells:
-            if cell.state.is_mine:
-                cell.state.is_revealed = True
-
-    def _check_win(self) -> None:
-        """Set win=True when all non-mine cells have been revealed."""
-        total_cells = self.cols * self.rows
-        if self.revealed_count == total_cells - self.num_mines and not self.game_over:
-            self.win = True
-            for cell in self.cells:
-                if not cell.state.is_revealed and not cell.state.is_mine:
-                    cell.state.is_revealed = True
+    """Minesweeper board state and rules.
+
+    Responsibilities:
+    - Generate and place mines with first-click safety
+    - Compute adjacency counts for every cell
+    - Reveal cells (scanline flood fill when adjacent == 0)
+    - Toggle flags, check win/lose conditions
+
+    Per-cell state lives in parallel bytearrays indexed by index(col,row):
+        is_mine: 1 if the cell contains a mine.
+        is_revealed: 1 if the cell has been revealed to the player.
+        is_flagged: 1 if the player flagged the cell as a mine.
+        adjacent: Number of adjacent mines in the 8 neighboring cells.
+    """
+
+    def __init__(self, cols: int, rows: int, mines: int):
+        self.cols = cols
+        self.rows = rows
+        self.num_mines = mines
+        size = cols * rows
+        self.is_mine = bytearray(size)
+        self.is_revealed = bytearray(size)
+        self.is_flagged = bytearray(size)
+        self.adjacent = bytearray(size)
+        self._mines_placed = False
+        self.revealed_count = 0
+        self.flagged = 0
+        self.game_over = False
+        self.win = False
+
+    def index(self, col: int, row: int) -> int:
+        """Return the flat list index for (col,row)."""
+        return row * self.cols + col
+
+    def is_inbounds(self, col: int, row: int) -> bool:
+        """Return True if (col,row) is inside the board bounds."""
+        return 0 <= col < self.cols and 0 <= row < self.rows
+
+    def neighbors(self, col: int, row: int) -> List[Tuple[int, int]]:
+        """Return list of valid neighboring coordinates around (col,row)."""
+        return [
+            (col + dc, row + dr) for dc, dr in _DELTAS
+            if 0 <= col + dc < self.cols and 0 <= row + dr < self.rows
+        ]
+
+    def place_mines(self, safe_col: int, safe_row: int) -> None:
+        """Place mines randomly, guaranteeing the first click and its neighbors are safe. Then compute adjacency counts."""
+        forbidden = {self.index(safe_col, safe_row)}
+        forbidden.update(self.index(c, r) for c, r in self.neighbors(safe_col, safe_row))
+        eligible = [i for i in range(self.cols * self.rows) if i not in forbidden]
+        mines = random.sample(eligible, min(self.num_mines, len(eligible)))
+
+        for i in mines:
+            self.is_mine[i] = 1
+
+        # Compute adjacency counts: each mine adds one to its neighbors
+        for i in mines:
+            r, c = divmod(i, self.cols)
+            for nc, nr in self.neighbors(c, r):
+                self.adjacent[self.index(nc, nr)] += 1
+
+        self._mines_placed = True
+
+    def reveal(self, col: int, row: int) -> List[int]:
+        """Reveal a cell; if zero-adjacent, flood-fill the surrounding region.
+
+        Returns the flat indices of every cell revealed by this call.
+        """
+        if not self.is_inbounds(col, row):
+            return []
+
+        i = self.index(col, row)
+
+        if self.is_revealed[i] or self.is_flagged[i]:
+            return []
+
+        if not self._mines_placed:
+            self.place_mines(col, row)
+
+        self.is_revealed[i] = 1
+        self.revealed_count += 1
+        changed = [i]
+        if self.is_mine[i]:
+            self.game_over = True
+            changed += self._reveal_all_mines()
+            return changed
+
+        if self.adjacent[i] == 0:
+            changed += self._flood(i)
+
+        changed += self._check_win()
+        return changed
+
+    def _flood(self, start: int) -> List[int]:
+        """Scanline flood fill from the revealed zero-adjacent cell at flat index start.
+
+        Each seed extends left and right along its row while cells are
+        zero-adjacent, also revealing the first numbered cell on each side.
+        The cells above and below that span are then revealed directly if
+        numbered, or pushed as one seed per run of zero-adjacent cells.
+        Flood cells always border a zero cell, so they are never mines.
+        Returns the flat indices revealed, excluding start.
+        """
+        cols, rows = self.cols, self.rows
+        is_revealed, is_flagged, adjacent = self.is_revealed, self.is_flagged, self.adjacent
+        # Cells that have been revealed by, or queued in, this flood
+        visited = bytearray(cols * rows)
+        visited[start] = 1
+        revealed = []
+        stack = [start]
+        while stack:
+            i = stack.pop()
+            if not is_revealed[i]:
+                is_revealed[i] = 1
+                revealed.append(i)
+            r, c = divmod(i, cols)
+            base = r * cols
+
+            # Extend the zero run [lo, hi] along the row
+            lo = c
+            span_lo = max(c - 1, 0)
+            while lo > 0:
+                ni = base + lo - 1
+                if visited[ni] or is_revealed[ni] or is_flagged[ni]:
+                    break
+                visited[ni] = 1
+                is_revealed[ni] = 1
+                revealed.append(ni)
+                if adjacent[ni]:
+                    break
+                lo -= 1
+                span_lo = max(lo - 1, 0)
+            hi = c
+            span_hi = min(c + 1, cols - 1)
+            while hi < cols - 1:
+                ni = base + hi + 1
+                if visited[ni] or is_revealed[ni] or is_flagged[ni]:
+                    break
+                visited[ni] = 1
+                is_revealed[ni] = 1
+                revealed.append(ni)
+                if adjacent[ni]:
+                    break
+                hi += 1
+                span_hi = min(hi + 1, cols - 1)
+
+            # Reveal or seed the rows above and below the span
+            for nr in (r - 1, r + 1):
+                if not 0 <= nr < rows:
+                    continue
+                nbase = nr * cols
+                in_run = False
+                for ni in range(nbase + span_lo, nbase + span_hi + 1):
+                    if visited[ni] or is_revealed[ni] or is_flagged[ni]:
+                        in_run = False
+                    elif adjacent[ni]:
+                        visited[ni] = 1
+                        is_revealed[ni] = 1
+                        revealed.append(ni)
+                        in_run = False
+                    elif not in_run:
+                        visited[ni] = 1
+                        stack.append(ni)
+                        in_run = True
+
+        self.revealed_count += len(revealed)
+        return revealed
+
+    def toggle_flag(self, col: int, row: int) -> None:
+        """Toggle a flag on a non-revealed cell."""
+        if not self.is_inbounds(col, row):
+            return
+        i = self.index(col, row)
+        if not self.is_revealed[i]:
+            self.flagged += -1 if self.is_flagged[i] else 1
+            self.is_flagged[i] ^= 1
+
+    def flagged_count(self) -> int:
+        """Return current number of flagged cells."""
+        return self.flagged
+
+    def _reveal_all_mines(self) -> List[int]:
+        """Reveal all mines; called on game over. Returns the newly revealed indices."""
+        changed = []
+        for i, mine in enumerate(self.is_mine):
+            if mine and not self.is_revealed[i]:
+                self.is_revealed[i] = 1
+                changed.append(i)
+        return changed
+
+    def _check_win(self) -> List[int]:
+        """Set win=True when all non-mine cells have been revealed. Returns the newly revealed indices."""
+        changed = []
+        total_cells = self.cols * self.rows
+        if self.revealed_count == total_cells - self.num_mines and not self.game_over:
+            self.win = True
+            for i, mine in enumerate(self.is_mine):
+                if not mine and not self.is_revealed[i]:
+                    self.is_revealed[i] = 1
+                    changed.append(i)
+        return changed
 
 
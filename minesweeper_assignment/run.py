@@ -18,236 +18,360 @@ from components import Board
 from pygame.locals import Rect
 
 class Renderer:
-    """Draws the Minesweeper UI.
-
-    Knows how to draw individual cells with flags/numbers, header info,
-    and end-of-game overlays with a semi-transparent background.
-    """
-
-    def __init__(self, screen: pygame.Surface, board: Board):
-        self.screen = screen
-        self.board = board
-        self.font = pygame.font.Font(config.font_name, config.font_size)
-        self.header_font = pygame.font.Font(config.font_name, config.header_font_size)
-        self.result_font = pygame.font.Font(config.font_name, config.result_font_size)
-
-    def cell_rect(self, col: int, row: int) -> Rect:
-        """Return the rectangle in pixels for the given grid cell."""
-        x = config.margin_left + col * config.cell_size
-        y = config.margin_top + row * config.cell_size
-        return Rect(x, y, config.cell_size, config.cell_size)
-
-    def draw_cell(self, col: int, row: int, highlighted: bool) -> None:
-        """Draw a single cell, respecting revealed/flagged state and highlight."""
-        cell = self.board.cells[self.board.index(col, row)]
-        rect = self.cell_rect(col, row)
-        if cell.state.is_revealed:
-            pygame.draw.rect(self.screen, config.color_cell_revealed, rect)
-            if cell.state.is_mine:
-                pygame.draw.circle(self.screen, config.color_cell_mine, rect.center, rect.width // 4)
-            elif cell.state.adjacent > 0:
-                color = config.number_colors.get(cell.state.adjacent, config.color_text)
-                label = self.font.render(str(cell.state.adjacent), True, color)
-                label_rect = label.get_rect(center=rect.center)
-                self.screen.blit(label, label_rect)
-        else:
-            base_color = config.color_highlight if highlighted else config.color_cell_hidden
-            pygame.draw.rect(self.screen, base_color, rect)
-            if cell.state.is_flagged:
-                flag_w = max(6, rect.width // 3)
-                flag_h = max(8, rect.height // 2)
-                pole_x = rect.left + rect.width // 3
-                pole_y = rect.top + 4
-                pygame.draw.line(self.screen, config.color_flag, (pole_x, pole_y), (pole_x, pole_y + flag_h), 2)
-                pygame.draw.polygon(
-                    self.screen,
-                    config.color_flag,
-                    [
-                        (pole_x + 2, pole_y),
-                        (pole_x + 2 + flag_w, pole_y + flag_h // 3),
-                        (pole_x + 2, pole_y + flag_h // 2),
-                    ],
-                )
-        pygame.draw.rect(self.screen, config.color_grid, rect, 1)
-
-    def draw_header(self, remaining_mines: int, time_text: str) -> None:
-        """Draw the header bar containing remaining mines and elapsed time."""
-        pygame.draw.rect(
-            self.screen,
-            config.color_header,
-            Rect(0, 0, config.width, config.margin_top - 4),
-        )
-        left_text = f"Mines: {remaining_mines}"
-        right_text = f"Time: {time_text}"
-        left_label = self.header_font.render(left_text, True, config.color_header_text)
-        right_label = self.header_font.render(right_text, True, config.color_header_text)
-        self.screen.blit(left_label, (10, 12))
-        self.screen.blit(right_label, (config.width - right_label.get_width() - 10, 12))
-
-    def draw_result_overlay(self, text: str | None) -> None:
-        """Draw a semi-transparent overlay with centered result text, if any."""
-        if not text:
-            return
-        overlay = pygame.Surface((config.width, config.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, config.result_overlay_alpha))
-        self.screen.blit(overlay, (0, 0))
-        label = self.result_font.render(text, True, config.color_result)
-        rect = label.get_rect(center=(config.width // 2, config.height // 2))
-        self.screen.blit(label, rect)
+    """Draws the Minesweeper UI.
+
+    Knows how to draw individual cells with flags/numbers, header info,
+    and end-of-game overlays with a semi-transparent background.
+
+    Cached surfaces are converted to the display pixel format, so the
+    renderer must be created after pygame.display.set_mode().
+    """
+
+    def __init__(self, screen: pygame.Surface, board: Board):
+        self.screen = screen
+        self.board = board
+        self.font = pygame.font.Font(config.font_name, config.font_size)
+        self.header_font = pygame.font.Font(config.font_name, config.header_font_size)
+        self.result_font = pygame.font.Font(config.font_name, config.result_font_size)
+        self.number_surfaces = {
+            n: self.font.render(str(n), True, config.number_colors.get(n, config.color_text)).convert_alpha()
+            for n in range(1, 9)
+        }
+        self.mine_surface = self._render_mine()
+        self.flag_surface = self._render_flag()
+        self._overlay: pygame.Surface | None = None
+        self._cached_size: tuple[int, int] | None = None
+        self.set_board(board)
+
+    def set_board(self, board: Board) -> None:
+        """Switch to a new board, rebuilding the board-dependent caches only if its size changed."""
+        self.board = board
+        if (board.cols, board.rows) == self._cached_size:
+            return
+        self._cached_size = (board.cols, board.rows)
+        self._cell_rects = self._build_cell_rects()
+        self._cell_inner_rects = [rect.inflate(-2, -2) for rect in self._cell_rects]
+        self._static_bg = self._render_static_bg()
+        self._overlay = None
+
+    def _build_cell_rects(self) -> list[Rect]:
+        """Return the pixel rectangle of every cell, indexed like the board arrays."""
+        return [
+            Rect(
+                config.margin_left + c * config.cell_size,
+                config.margin_top + r * config.cell_size,
+                config.cell_size,
+                config.cell_size,
+            )
+            for r in range(self.board.rows)
+            for c in range(self.board.cols)
+        ]
+
+    def _render_static_bg(self) -> pygame.Surface:
+        """Pre-render the window background, header box, grid lines, and all cells in their hidden state."""
+        bg = pygame.Surface(self.screen.get_size())
+        bg.fill(config.color_bg)
+        pygame.draw.rect(bg, config.color_header, Rect(0, 0, config.width, config.margin_top - 4))
+        size = config.cell_size
+        grid = Rect(config.margin_left, config.margin_top, self.board.cols * size, self.board.rows * size)
+        pygame.draw.rect(bg, config.color_cell_hidden, grid)
+        # Every cell has a 1px border, so lines between two cells are 2px wide
+        for c in range(self.board.cols + 1):
+            for x in (grid.left + c * size - 1, grid.left + c * size):
+                if grid.left <= x < grid.right:
+                    pygame.draw.line(bg, config.color_grid, (x, grid.top), (x, grid.bottom - 1))
+        for r in range(self.board.rows + 1):
+            for y in (grid.top + r * size - 1, grid.top + r * size):
+                if grid.top <= y < grid.bottom:
+                    pygame.draw.line(bg, config.color_grid, (grid.left, y), (grid.right - 1, y))
+        return bg.convert()
+
+    def _render_mine(self) -> pygame.Surface:
+        """Pre-render the mine marker for a revealed mine cell."""
+        size = config.cell_size
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surface, config.color_cell_mine, (size // 2, size // 2), size // 4)
+        return surface.convert_alpha()
+
+    def _render_flag(self) -> pygame.Surface:
+        """Pre-render the flag marker for a flagged cell."""
+        size = config.cell_size
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        flag_w = max(6, size // 3)
+        flag_h = max(8, size // 2)
+        pole_x = size // 3
+        pole_y = 4
+        pygame.draw.line(surface, config.color_flag, (pole_x, pole_y), (pole_x, pole_y + flag_h), 2)
+        pygame.draw.polygon(
+            surface,
+            config.color_flag,
+            [
+                (pole_x + 2, pole_y),
+                (pole_x + 2 + flag_w, pole_y + flag_h // 3),
+                (pole_x + 2, pole_y + flag_h // 2),
+            ],
+        )
+        return surface.convert_alpha()
+
+    def cell_rect(self, col: int, row: int) -> Rect:
+        """Return the rectangle in pixels for the given grid cell (shared; do not modify)."""
+        return self._cell_rects[row * self.board.cols + col]
+
+    def draw_background(self) -> None:
+        """Blit the cached background; cells left untouched render as hidden."""
+        self.screen.blit(self._static_bg, (0, 0))
+
+    def draw_cell(self, col: int, row: int, highlighted: bool) -> None:
+        """Draw a single cell, respecting revealed/flagged state and highlight.
+
+        Only the cell interior is painted; the grid border comes from the
+        static background.
+        """
+        board = self.board
+        i = board.index(col, row)
+        rect = self.cell_rect(col, row)
+        inner = self._cell_inner_rects[i]
+        if board.is_revealed[i]:
+            pygame.draw.rect(self.screen, config.color_cell_revealed, inner)
+            adjacent = board.adjacent[i]
+            if board.is_mine[i]:
+                self.screen.blit(self.mine_surface, rect)
+            elif adjacent > 0:
+                label = self.number_surfaces[adjacent]
+                label_rect = label.get_rect(center=rect.center)
+                self.screen.blit(label, label_rect)
+        else:
+            base_color = config.color_highlight if highlighted else config.color_cell_hidden
+            pygame.draw.rect(self.screen, base_color, inner)
+            if board.is_flagged[i]:
+                self.screen.blit(self.flag_surface, rect)
+
+    def draw_header(self, remaining_mines: int, time_text: str) -> Rect:
+        """Draw the header bar containing remaining mines and elapsed time; return its rectangle."""
+        header_rect = Rect(0, 0, config.width, config.margin_top - 4)
+        pygame.draw.rect(self.screen, config.color_header, header_rect)
+        left_text = f"Mines: {remaining_mines}"
+        right_text = f"Time: {time_text}"
+        left_label = self.header_font.render(left_text, True, config.color_header_text)
+        right_label = self.header_font.render(right_text, True, config.color_header_text)
+        self.screen.blit(left_label, (10, 12))
+        self.screen.blit(right_label, (config.width - right_label.get_width() - 10, 12))
+        return header_rect
+
+    def draw_result_overlay(self, text: str | None) -> None:
+        """Draw a semi-transparent overlay with centered result text, if any."""
+        if not text:
+            return
+        if self._overlay is None or self._overlay.get_size() != (config.width, config.height):
+            self._overlay = pygame.Surface((config.width, config.height), pygame.SRCALPHA).convert_alpha()
+            self._overlay.fill((0, 0, 0, config.result_overlay_alpha))
+        self.screen.blit(self._overlay, (0, 0))
+        label = self.result_font.render(text, True, config.color_result)
+        rect = label.get_rect(center=(config.width // 2, config.height // 2))
+        self.screen.blit(label, rect)
 
 class InputController:
-    """Translates input events into game and board actions."""
-
-    def __init__(self, game: "Game"):
-        self.game = game
-
-    def pos_to_grid(self, x: int, y: int):
-        """Convert pixel coordinates to (col,row) grid indices or (-1,-1) if out of bounds."""
-        if not (config.margin_left <= x < config.width - config.margin_right):
-            return -1, -1
-        if not (config.margin_top <= y < config.height - config.margin_bottom):
-            return -1, -1
-        col = (x - config.margin_left) // config.cell_size
-        row = (y - config.margin_top) // config.cell_size
-        if 0 <= col < self.game.board.cols and 0 <= row < self.game.board.rows:
-            return int(col), int(row)
-        return -1, -1
-
-    def handle_mouse(self, pos, button) -> None:
-        # Convert pixel pos to grid indices
-        col, row = self.pos_to_grid(pos[0], pos[1])
-        if col == -1:
-            return
-
-        game = self.game
-
-        # LEFT CLICK: reveal
-        if button == config.mouse_left:
-            # clear any temporary highlights
-            game.highlight_targets.clear()
-
-            # start the timer on first action
-            if not game.started:
-                game.started = True
-                game.start_ticks_ms = pygame.time.get_ticks()
-
-            # reveal the clicked cell (Board.reveal should handle game rules)
-            game.board.reveal(col, row)
-
-        # RIGHT CLICK: toggle flag
-        elif button == config.mouse_right:
-            game.highlight_targets.clear()
-            game.board.toggle_flag(col, row)
-
-        # MIDDLE CLICK: highlight neighbors (excluding already revealed)
-        elif button == config.mouse_middle:
-            # get neighbor coordinates from board; expect neighbors(col,row) -> list of (c,r)
-            try:
-                neighbors = game.board.neighbors(col, row)
-            except Exception:
-                neighbors = []
-
-            game.highlight_targets = {
-                (nc, nr)
-                for (nc, nr) in neighbors
-                if not game.board.cells[game.board.index(nc, nr)].state.is_revealed
-            }
-
-            game.highlight_until_ms = pygame.time.get_ticks() + config.highlight_duration_ms
+    """Translates input events into game and board actions."""
+
+    def __init__(self, game: "Game"):
+        self.game = game
+
+    def pos_to_grid(self, x: int, y: int):
+        """Convert pixel coordinates to (col,row) grid indices or (-1,-1) if out of bounds."""
+        if not (config.margin_left <= x < config.width - config.margin_right):
+            return -1, -1
+        if not (config.margin_top <= y < config.height - config.margin_bottom):
+            return -1, -1
+        col = (x - config.margin_left) // config.cell_size
+        row = (y - config.margin_top) // config.cell_size
+        if 0 <= col < self.game.board.cols and 0 <= row < self.game.board.rows:
+            return int(col), int(row)
+        return -1, -1
+
+    def handle_mouse(self, pos, button) -> None:
+        # Convert pixel pos to grid indices
+        col, row = self.pos_to_grid(pos[0], pos[1])
+        if col == -1:
+            return
+
+        game = self.game
+
+        # LEFT CLICK: reveal
+        if button == config.mouse_left:
+            # clear any temporary highlights
+            game.clear_highlight()
+
+            # start the timer on first action
+            if not game.started:
+                game.started = True
+                game.start_ticks_ms = pygame.time.get_ticks()
+
+            # reveal the clicked cell (Board.reveal should handle game rules)
+            game.dirty.update(game.board.reveal(col, row))
+
+        # RIGHT CLICK: toggle flag
+        elif button == config.mouse_right:
+            game.clear_highlight()
+            game.board.toggle_flag(col, row)
+            game.dirty.add(game.board.index(col, row))
+
+        # MIDDLE CLICK: highlight neighbors (excluding already revealed)
+        elif button == config.mouse_middle:
+            # get neighbor coordinates from board; expect neighbors(col,row) -> list of (c,r)
+            try:
+                neighbors = game.board.neighbors(col, row)
+            except Exception:
+                neighbors = []
+
+            game.clear_highlight()
+            for nc, nr in neighbors:
+                i = game.board.index(nc, nr)
+                if not game.board.is_revealed[i]:
+                    game.highlight_targets[i] = 1
+                    game.dirty.add(i)
+
+            game.highlight_until_ms = pygame.time.get_ticks() + config.highlight_duration_ms
 
 
 class Game:
-    """Main application object orchestrating loop and high-level state."""
-
-    def __init__(self):
-        pygame.init()
-        pygame.display.set_caption(config.title)
-        self.screen = pygame.display.set_mode(config.display_dimension)
-        self.clock = pygame.time.Clock()
-        self.board = Board(config.cols, config.rows, config.num_mines)
-        self.renderer = Renderer(self.screen, self.board)
-        self.input = InputController(self)
-        self.highlight_targets = set()
-        self.highlight_until_ms = 0
-        self.started = False
-        self.start_ticks_ms = 0
-        self.end_ticks_ms = 0
-
-    def reset(self):
-        """Reset the game state and start a new board."""
-        self.board = Board(config.cols, config.rows, config.num_mines)
-        self.renderer.board = self.board
-        self.highlight_targets.clear()
-        self.highlight_until_ms = 0
-        self.started = False
-        self.start_ticks_ms = 0
-        self.end_ticks_ms = 0
-
-    def _elapsed_ms(self) -> int:
-        """Return elapsed time in milliseconds (stops when game ends)."""
-        if not self.started:
-            return 0
-        if self.end_ticks_ms:
-            return self.end_ticks_ms - self.start_ticks_ms
-        return pygame.time.get_ticks() - self.start_ticks_ms
-
-    def _format_time(self, ms: int) -> str:
-        """Format milliseconds as mm:ss string."""
-        total_seconds = ms // 1000
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
-
-    def _result_text(self) -> str | None:
-        """Return result label to display, or None if game continues."""
-        if self.board.game_over:
-            return "GAME OVER"
-        if self.board.win:
-            return "GAME CLEAR"
-        return None
-
-    def draw(self):
-        """Render one frame: header, grid, result overlay."""
-        if pygame.time.get_ticks() > self.highlight_until_ms and self.highlight_targets:
-            self.highlight_targets.clear()
-        self.screen.fill(config.color_bg)
-        remaining = max(0, config.num_mines - self.board.flagged_count())
-        time_text = self._format_time(self._elapsed_ms())
-        self.renderer.draw_header(remaining, time_text)
-        now = pygame.time.get_ticks()
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                highlighted = (now <= self.highlight_until_ms) and ((c, r) in self.highlight_targets)
-                self.renderer.draw_cell(c, r, highlighted)
-        self.renderer.draw_result_overlay(self._result_text())
-        pygame.display.flip()
-
-    def run_step(self) -> bool:
-        """Process inputs, update time, draw, and tick the clock once."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    self.reset()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                self.input.handle_mouse(event.pos, event.button)
-        if (self.board.game_over or self.board.win) and self.started and not self.end_ticks_ms:
-            self.end_ticks_ms = pygame.time.get_ticks()
-        self.draw()
-        self.clock.tick(config.fps)
-        return True
+    """Main application object orchestrating loop and high-level state."""
+
+    def __init__(self):
+        pygame.init()
+        pygame.display.set_caption(config.title)
+        self.screen = pygame.display.set_mode(config.display_dimension)
+        self.clock = pygame.time.Clock()
+        self.board = Board(config.cols, config.rows, config.num_mines)
+        self.renderer = Renderer(self.screen, self.board)
+        self.input = InputController(self)
+        # 1 per highlighted cell, indexed like the board arrays; highlight_until_ms == 0 means none
+        self.highlight_targets = bytearray(self.board.cols * self.board.rows)
+        self.highlight_until_ms = 0
+        self.started = False
+        self.start_ticks_ms = 0
+        self.end_ticks_ms = 0
+        # Flat indices of cells to redraw on the next frame
+        self.dirty = set()
+        self._full_redraw = True
+        self._drawn_result = None
+
+    def reset(self):
+        """Reset the game state and start a new board."""
+        self.board = Board(config.cols, config.rows, config.num_mines)
+        self.renderer.set_board(self.board)
+        self.highlight_targets = bytearray(self.board.cols * self.board.rows)
+        self.highlight_until_ms = 0
+        self.started = False
+        self.start_ticks_ms = 0
+        self.end_ticks_ms = 0
+        self.dirty.clear()
+        self._full_redraw = True
+
+    def clear_highlight(self) -> None:
+        """Remove the neighbor highlight, marking the affected cells for redraw."""
+        if not self.highlight_until_ms:
+            return
+        for i, highlighted in enumerate(self.highlight_targets):
+            if highlighted:
+                self.dirty.add(i)
+        self.highlight_targets[:] = bytes(len(self.highlight_targets))
+        self.highlight_until_ms = 0
+
+    def _elapsed_ms(self) -> int:
+        """Return elapsed time in milliseconds (stops when game ends)."""
+        if not self.started:
+            return 0
+        if self.end_ticks_ms:
+            return self.end_ticks_ms - self.start_ticks_ms
+        return pygame.time.get_ticks() - self.start_ticks_ms
+
+    def _format_time(self, ms: int) -> str:
+        """Format milliseconds as mm:ss string."""
+        total_seconds = ms // 1000
+        minutes = total_seconds // 60
+        seconds = total_seconds % 60
+        return f"{minutes:02d}:{seconds:02d}"
+
+    def _result_text(self) -> str | None:
+        """Return result label to display, or None if game continues."""
+        if self.board.game_over:
+            return "GAME OVER"
+        if self.board.win:
+            return "GAME CLEAR"
+        return None
+
+    def _draw_header(self) -> Rect:
+        """Draw the header with the remaining mine count and elapsed time."""
+        remaining = max(0, config.num_mines - self.board.flagged_count())
+        time_text = self._format_time(self._elapsed_ms())
+        return self.renderer.draw_header(remaining, time_text)
+
+    def draw(self):
+        """Render one frame: header, grid, result overlay.
+
+        The screen is repainted and flipped in full only after a reset or when
+        the result overlay changes; other frames redraw the header and the
+        dirty cells and push just those rectangles to the display.
+        """
+        if self.highlight_until_ms and pygame.time.get_ticks() > self.highlight_until_ms:
+            self.clear_highlight()
+        board = self.board
+        result = self._result_text()
+        # The overlay is translucent, so changes underneath it need a full repaint
+        if result != self._drawn_result or (result and self.dirty):
+            self._full_redraw = True
+        if self._full_redraw:
+            self.renderer.draw_background()
+            self._draw_header()
+            for r in range(board.rows):
+                for c in range(board.cols):
+                    i = board.index(c, r)
+                    highlighted = self.highlight_targets[i]
+                    # Plain hidden cells are already part of the static background
+                    if board.is_revealed[i] or board.is_flagged[i] or highlighted:
+                        self.renderer.draw_cell(c, r, highlighted)
+            self.renderer.draw_result_overlay(result)
+            self._full_redraw = False
+            self._drawn_result = result
+            self.dirty.clear()
+            pygame.display.flip()
+            return
+        rects_to_update = []
+        if result is None:
+            rects_to_update.append(self._draw_header())
+            for i in self.dirty:
+                r, c = divmod(i, board.cols)
+                self.renderer.draw_cell(c, r, self.highlight_targets[i])
+                rects_to_update.append(self.renderer.cell_rect(c, r))
+        self.dirty.clear()
+        pygame.display.update(rects_to_update)
+
+    def run_step(self) -> bool:
+        """Process inputs, update time, draw, and tick the clock once."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    self.reset()
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.input.handle_mouse(event.pos, event.button)
+        if (self.board.game_over or self.board.win) and self.started and not self.end_ticks_ms:
+            self.end_ticks_ms = pygame.time.get_ticks()
+        self.draw()
+        self.clock.tick(config.fps)
+        return True
 
 def main() -> int:
-    """Application entrypoint: run the main loop until quit."""
-    game = Game()
-    running = True
-    while running:
-        running = game.run_step()
-    pygame.quit()
-    return 0
+    """Application entrypoint: run the main loop until quit."""
+    game = Game()
+    running = True
+    while running:
+        running = game.run_step()
+    pygame.quit()
+    return 0
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main())
 
 
@@ -0,0 +1,19 @@
+"""
+Optional build script that compiles the Minesweeper board logic with Cython.
+
+components.py stays plain Python and remains the fallback when no compiled
+module is present. To build the extension in place, run from this directory:
+
+    python setup.py build_ext --inplace
+
+Python then imports the compiled components module ahead of components.py.
+Delete the generated extension file to go back to the pure-Python module.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="minesweeper-components",
+    ext_modules=cythonize("components.py", compiler_directives={"language_level": "3"}),
+)